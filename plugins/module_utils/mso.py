@@ -39,6 +39,13 @@ try:
 except ImportError:
     HAS_MULTIPART_ENCODER = False
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 if PY3:
 
@@ -98,6 +105,35 @@ def issubset(subset, superset):
     return True
 
 
+# orjson parses integers outside of the 64-bit range as floats, data with 19 or more consecutive digits is parsed by json to keep the exact value
+LONG_NUMBER_REGEX = re.compile("[0-9]{19}")
+LONG_NUMBER_BYTES_REGEX = re.compile(b"[0-9]{19}")
+
+
+def json_dumps(data):
+    """Serialize request data to a JSON string, uses the faster orjson library when it is installed"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            # orjson only supports a subset of the types json supports, for example it does not accept non-string dict keys
+            pass
+    return json.dumps(data)
+
+
+def json_loads(data):
+    """Deserialize a JSON response body of MSOModule.request, uses the faster orjson library when it is installed and the result is the same as json"""
+    if HAS_ORJSON:
+        long_number_regex = LONG_NUMBER_BYTES_REGEX if isinstance(data, (bytes, bytearray)) else LONG_NUMBER_REGEX
+        if not long_number_regex.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json, for example it does not accept NaN, Infinity or lone surrogates
+                pass
+    return json.loads(data)
+
+
 def update_qs(params):
     """Append key-value pairs to self.filter_string"""
     accepted_params = dict((k, v) for (k, v) in params.items() if v is not None)
@@ -897,13 +933,13 @@ class MSOModule(object):
                 uri = uri + update_qs(qs)
 
             try:
-                info = self.connection.send_request(method, uri, json.dumps(data))
+                info = self.connection.send_request(method, uri, json_dumps(data))
                 self.url = info.get("url")
                 self.httpapi_logs.extend(self.connection.pop_messages())
                 info.pop("date", None)
             except Exception as e:
                 try:
-                    error_obj = json.loads(to_text(e))
+                    error_obj = json_loads(to_text(e))
                 except Exception:
                     error_obj = dict(
                         error=dict(code=-1, message="Unable to parse error output as JSON. Raw error message: {0}".format(e), exception=to_text(e))
@@ -924,7 +960,7 @@ class MSOModule(object):
                 self.module,
                 self.url,
                 headers=self.headers,
-                data=json.dumps(data),
+                data=json_dumps(data),
                 method=self.method,
                 timeout=self.params.get("timeout"),
                 use_proxy=self.params.get("use_proxy"),
@@ -947,7 +983,7 @@ class MSOModule(object):
                 output = resp.read()
                 if output:
                     try:
-                        return json.loads(output)
+                        return json_loads(output)
                     except Exception as e:
                         self.error = dict(code=-1, message="Unable to parse output as JSON, see 'raw' output. {0}".format(e))
                         self.result["raw"] = output
@@ -974,7 +1010,7 @@ class MSOModule(object):
                     if isinstance(body, dict):
                         payload = body
                     else:
-                        payload = json.loads(body)
+                        payload = json_loads(body)
 
                     if ignore_errors:
                         for error in ignore_errors:
@@ -112,13 +112,38 @@ class MSOTemplate:
         if search_list is None:
             return None, []
 
-        def kv_match(kvs, item):
-            return all((item.get(kv.key) == kv.value for kv in kvs))
-
-        match = next((Item(index, item) for index, item in enumerate(search_list) if kv_match(kv_list, item)), None)
-        existing = [item.get(kv.key) for item in search_list for kv in kv_list if item.get(kv.key) is not None]
+        match = MSOTemplate.get_object_match_from_list(search_list, kv_list)
+        existing = MSOTemplate.get_existing_values_from_list(search_list, kv_list)
         return match, existing
 
+    @staticmethod
+    def get_object_match_from_list(search_list, kv_list):
+        """
+        Get the first matched object from a list of mso object dictionaries, stops searching at the first match.
+        :param search_list: Objects to search through -> List.
+        :param kv_list: Key/value pairs that should match in the object. -> List[KVPair(Str, Str)]
+        :return: The index and details of the object. -> Item (Named Tuple) | None
+        """
+        if search_list is None:
+            return None
+
+        for index, item in enumerate(search_list):
+            if all(item.get(kv.key) == kv.value for kv in kv_list):
+                return Item(index, item)
+        return None
+
+    @staticmethod
+    def get_existing_values_from_list(search_list, kv_list):
+        """
+        Get the values of the provided keys of all objects in a list of mso object dictionaries.
+        :param search_list: Objects to search through -> List.
+        :param kv_list: Key/value pairs of which the keys are used. -> List[KVPair(Str, Str)]
+        :return: Values of provided keys of all existing objects. -> List
+        """
+        if search_list is None:
+            return []
+        return [item.get(kv.key) for item in search_list for kv in kv_list if item.get(kv.key) is not None]
+
     def validate_template(self, template_type):
         """
         Validate that attributes are set to a value that is not equal None.
@@ -138,8 +163,10 @@ class MSOTemplate:
         :param fail_module: When match is not found fail the ansible module. -> Bool
         :return: The object. -> Dict | None
         """
-        match, existing = self.get_object_from_list(search_list, kv_list)
+        match = self.get_object_match_from_list(search_list, kv_list)
         if not match and fail_module:
+            # The values of the existing objects are only collected for the error message
+            existing = self.get_existing_values_from_list(search_list, kv_list)
             msg = "Provided {0} with '{1}' not matching existing object(s): {2}".format(object_description, kv_list, ", ".join(existing))
             self.mso.fail_json(msg=msg)
         return match
@@ -898,17 +925,18 @@ class MSOTemplate:
     def clear_template_objects_cache(self):
         self.template_objects_cache = {}
 
-    def get_template_object_name_by_uuid(self, object_type, uuid, fail_module=True):
+    def get_template_object_name_by_uuid(self, object_type, uuid, fail_module=True, use_cache=False):
         """
         Retrieve the name of a specific object type in the MSO template using its UUID.
         :param mso: An instance of the MSO class, which provides methods for making API requests -> MSO Class instance
         :param object_type: The type of the object to retrieve the name for -> Str
         :param uuid: The UUID of the object to retrieve the name for -> Str
+        :param use_cache: Use the cached result of the templates/objects API for the UUID -> Bool
         :return: Str | None: The processed result which could be:
               When the UUID is existing, returns object name -> Str
               When the UUID is not existing -> None
         """
-        response_object = self.get_template_object_by_uuid(object_type, uuid, fail_module)
+        response_object = self.get_template_object_by_uuid(object_type, uuid, fail_module, use_cache)
         if response_object:
             return response_object.get("name")
 
@@ -923,7 +951,7 @@ class MSOTemplate:
             When the UUID is not existing -> None
         """
         response_object = None
-        if use_cache and uuid in self.template_objects_cache.keys():
+        if use_cache and uuid in self.template_objects_cache:
             response_object = self.template_objects_cache[uuid]
         else:
             response_object = self.mso.request("templates/objects?type={0}&uuid={1}".format(object_type, uuid), "GET")
@@ -15,14 +15,16 @@ class MSOTemplates:
 
     def get_template(self, template_type, template_name, template_id, refresh=False, fail_module=False):
         if not refresh:
-            if template_id in self.templates_by_id:
+            if template_id and template_id in self.templates_by_id:
                 return self.templates_by_id[template_id]
-            elif (template_name, TEMPLATE_TYPES[template_type]["template_type"]) in self.templates_by_name:
+            elif template_name and (template_name, TEMPLATE_TYPES[template_type]["template_type"]) in self.templates_by_name:
                 return self.templates_by_name[(template_name, TEMPLATE_TYPES[template_type]["template_type"])]
 
         new_template = MSOTemplate(self.mso, template_type, template_name, template_id, fail_module=fail_module)
-        self.templates_by_id[new_template.template_id] = new_template
-        self.templates_by_name[(new_template.template_name, new_template.template_type)] = new_template
+        # Only cache existing templates, a template that is not found or a list of template summaries has no template id
+        if new_template.template_id:
+            self.templates_by_id[new_template.template_id] = new_template
+            self.templates_by_name[(new_template.template_name, new_template.template_type)] = new_template
         return new_template
 
     def get_object_uuid_from_template(self, template_type, object_type, uuid, obj, refresh=False):
@@ -6,7 +6,8 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
-import copy
+
+from ansible.module_utils.six.moves.urllib.parse import urlencode
 
 
 def generate_api_endpoint(path, **kwargs):
@@ -15,9 +16,24 @@ def generate_api_endpoint(path, **kwargs):
 
     :param path: The base URL of the API endpoint. -> Str
     :param kwargs: Keyword arguments representing query parameters. -> Dict
-    :return: A string representing the full API endpoint with query parameters. -> Str
+    :return: A string representing the full API endpoint with url encoded query parameters. -> Str
     """
-    return path if not kwargs else "{0}?{1}".format(path, "&".join(["{0}={1}".format(key, value) for key, value in kwargs.items()]))
+    return path if not kwargs else "{0}?{1}".format(path, urlencode(kwargs))
+
+
+def copy_nested_data(data):
+    """
+    Copies the nested dict and list structure of API payload data, values of any other type are immutable and returned as is.
+    This is a lightweight alternative to copy.deepcopy for JSON serializable data.
+
+    :param data: The data to copy -> Any
+    :return: A copy of the data which does not share dict or list objects with the original -> Any
+    """
+    if isinstance(data, dict):
+        return {key: copy_nested_data(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [copy_nested_data(item) for item in data]
+    return data
 
 
 def append_update_ops_data(ops, existing_data, update_path, replace_data=None, remove_data=None):
@@ -91,51 +107,52 @@ def append_update_ops_data(ops, existing_data, update_path, replace_data=None, r
     ]
     """
 
-    def recursive_add_replace(data, path, keys, new_value):
-        key = keys[0]
-        if len(keys) == 1:
-            # Update the existing configuration
-            if new_value is not None and data.get(key) != new_value:
-                operation = "replace" if data.get(key) is not None else "add"
-                data[key] = new_value
-                ops.append(
-                    dict(
-                        op=operation,
-                        path="{}/{}".format(path, key),
-                        value=copy.deepcopy(new_value),
-                    )
-                )
-        elif key in data:
-            recursive_add_replace(data[key], "{}/{}".format(path, key), keys[1:], new_value)
+    append_ops = ops.append
 
-    def recursive_delete(data, path, keys):
-        key = keys[0]
-        if len(keys) == 1:
-            # Clear the existing configuration
-            if key in data:
-                data.pop(key)
-                ops.append(
-                    dict(
-                        op="remove",
-                        path="{}/{}".format(path, key),
-                    )
-                )
-        elif key in data:
-            recursive_delete(data[key], "{}/{}".format(path, key), keys[1:])
+    def get_parent_data(keys):
+        # Walk down to the parent of the last key, returns None when a parent does not exist
+        data = existing_data
+        for parent_key in keys[:-1]:
+            if parent_key not in data:
+                return None
+            data = data[parent_key]
+        return data
 
     if replace_data:
         if not isinstance(replace_data, dict):
             raise TypeError("replace_data must be a dict")
 
-        for key, value in replace_data.items():
-            recursive_add_replace(existing_data, update_path, key if isinstance(key, tuple) else (key,), value)
+        # Normalize single keys to a tuple of keys once, before walking the existing data
+        replace_items = [(key if isinstance(key, tuple) else (key,), new_value) for key, new_value in replace_data.items()]
+
+        for keys, new_value in replace_items:
+            data = get_parent_data(keys)
+            # Update the existing configuration, the identity check avoids a full compare of nested values that are not changed
+            if data is not None and new_value is not None:
+                key = keys[-1]
+                existing_value = data.get(key)
+                if existing_value is not new_value and existing_value != new_value:
+                    data[key] = new_value
+                    append_ops(
+                        {
+                            "op": "replace" if existing_value is not None else "add",
+                            "path": "{0}/{1}".format(update_path, "/".join(keys)),
+                            "value": copy_nested_data(new_value),
+                        }
+                    )
 
     if remove_data:
         if not isinstance(remove_data, list):
             raise TypeError("remove_data must be a list of string or tuples")
 
-        for key in remove_data:
-            recursive_delete(existing_data, update_path, key if isinstance(key, tuple) else (key,))
+        remove_items = [key if isinstance(key, tuple) else (key,) for key in remove_data]
+
+        for keys in remove_items:
+            data = get_parent_data(keys)
+            # Clear the existing configuration
+            if data is not None and keys[-1] in data:
+                data.pop(keys[-1])
+                append_ops({"op": "remove", "path": "{0}/{1}".format(update_path, "/".join(keys))})
 
 
 def check_if_all_elements_are_none(values):
@@ -145,7 +162,10 @@ def check_if_all_elements_are_none(values):
     :param values: An iterable containing values to be checked -> Iterable[Any]
     :return: True if all elements are None, False otherwise -> Bool
     """
-    return all(value is None for value in values)
+    for value in values:
+        if value is not None:
+            return False
+    return True
 
 
 def snake_to_camel(snake_str, upper_case_components=None):
@@ -176,22 +196,14 @@ def delete_none_values(obj_to_sanitize, recursive=True):
     :return: A sanitized copy of the original Python object, with all keys with None values removed. -> List or Dict
     """
     if isinstance(obj_to_sanitize, dict):
-        sanitized_dict = {}
-        for item_key, item_value in obj_to_sanitize.items():
-            if recursive and isinstance(item_value, (dict, list)):
-                sanitized_dict[item_key] = delete_none_values(item_value, recursive)
-            elif item_value is not None:
-                sanitized_dict[item_key] = item_value
-        return sanitized_dict
+        return {
+            item_key: delete_none_values(item_value, recursive) if recursive and isinstance(item_value, (dict, list)) else item_value
+            for item_key, item_value in obj_to_sanitize.items()
+            if item_value is not None
+        }
 
     elif isinstance(obj_to_sanitize, list):
-        sanitized_list = []
-        for item in obj_to_sanitize:
-            if recursive and isinstance(item, (dict, list)):
-                sanitized_list.append(delete_none_values(item, recursive))
-            elif item is not None:
-                sanitized_list.append(item)
-        return sanitized_list
+        return [delete_none_values(item, recursive) if recursive and isinstance(item, (dict, list)) else item for item in obj_to_sanitize if item is not None]
 
     else:
         raise TypeError("Object to sanitize must be of type list or dict. Got {}".format(type(obj_to_sanitize)))
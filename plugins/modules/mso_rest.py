@@ -149,6 +149,7 @@ def main():
 
     content = module.params.get("content")
     path = module.params.get("path")
+    method = module.params.get("method")
 
     mso = MSOModule(module)
 
@@ -160,7 +161,7 @@ def main():
         except Exception as e:
             module.fail_json(msg="Failed to parse provided JSON/YAML payload: %s" % to_text(e), exception=to_text(e), payload=content)
 
-    mso.method = mso.params.get("method").upper()
+    mso.method = method.upper()
 
     # Perform request
     if module.check_mode:
@@ -276,9 +276,9 @@ def main():
 def insert_dhcp_relay_policy_relation_name(dhcp_relay_policy, mso_template):
     for provider in dhcp_relay_policy.get("providers"):
         if provider.get("epgRef"):
-            provider["epgName"] = mso_template.get_template_object_name_by_uuid("epg", provider.get("epgRef"))
+            provider["epgName"] = mso_template.get_template_object_name_by_uuid("epg", provider.get("epgRef"), use_cache=True)
         if provider.get("externalEpgRef"):
-            provider["externalEpgName"] = mso_template.get_template_object_name_by_uuid("externalEpg", provider.get("externalEpgRef"))
+            provider["externalEpgName"] = mso_template.get_template_object_name_by_uuid("externalEpg", provider.get("externalEpgRef"), use_cache=True)
     return dhcp_relay_policy
 
 
@@ -514,7 +514,7 @@ def main():
     max_links = module.params.get("max_links")
     controls = module.params.get("controls")
     if controls:
-        controls = [CONTROL_MAP.get(v) for v in controls]
+        controls = list(map(CONTROL_MAP.get, controls))
     load_balance_hashing = LOAD_BALANCE_HASHING_MAP.get(module.params.get("load_balance_hashing"))
     synce = module.params.get("synce")
     link_level_debounce_interval = module.params.get("link_level_debounce_interval")
@@ -780,8 +780,7 @@ def main():
 
     if bgp_peer_objects and (ipv4_addr or ipv6_addr):
         set_bgp_peer_details(mso_template, parent_type, parent_object.details, bgp_peer_objects.details)
-        mso.existing = copy.deepcopy(bgp_peer_objects.details)  # Query a specific object
-        mso.previous = copy.deepcopy(bgp_peer_objects.details)  # Query a specific object
+        mso.existing = mso.previous = copy.deepcopy(bgp_peer_objects.details)  # Query a specific object
     elif bgp_peer_objects:
         mso.existing = [set_bgp_peer_details(mso_template, parent_type, parent_object.details, bgp_peer) for bgp_peer in bgp_peer_objects]  # Query all objects
 
@@ -927,7 +926,6 @@ def main():
 
             if mso.existing.get("password", {}).get("ref"):
                 mso.existing["password"].pop("ref", None)
-                mso.previous["password"].pop("ref", None)
 
             if auth_password == "" and "password" in proposed_payload:
                 mso_values["authEnabled"] = False
@@ -478,7 +478,7 @@ def main():
             process_tenant_policy(mso_values, tenant_template, custom_qos_policy, "qosRef", "qosPolicies")
         else:
             if interface_routing_policy:
-                empty_interface_routing_policy = check_if_all_elements_are_none(list(interface_routing_policy.values()))
+                empty_interface_routing_policy = check_if_all_elements_are_none(interface_routing_policy.values())
                 if not empty_interface_routing_policy:
                     tenant_template_interface = MSOTemplate(
                         mso, "tenant", interface_routing_policy.get("template"), interface_routing_policy.get("template_id")
@@ -487,7 +487,7 @@ def main():
                     process_tenant_policy(mso_values, tenant_template_interface, interface_routing_policy, "interfaceRoutingPolicyRef", "l3OutIntfPolGroups")
 
             if custom_qos_policy:
-                empty_custom_qos_policy = check_if_all_elements_are_none(list(custom_qos_policy.values()))
+                empty_custom_qos_policy = check_if_all_elements_are_none(custom_qos_policy.values())
                 if not empty_custom_qos_policy:
                     tenant_template_qos = MSOTemplate(mso, "tenant", custom_qos_policy.get("template"), custom_qos_policy.get("template_id"))
                     tenant_template_qos.validate_template("tenantPolicy")
@@ -503,7 +503,7 @@ def main():
 
             for protocol_name, protocol_dict in protocols_dict.items():
                 if protocol_dict is not None:
-                    attribute_is_empty = check_if_all_elements_are_none(list(protocol_dict.values()))
+                    attribute_is_empty = check_if_all_elements_are_none(protocol_dict.values())
 
                     if match.details.get(protocol_name, {}).get("key", {}).get("ref"):
                         match.details[protocol_name]["key"].pop("ref", None)
@@ -249,8 +249,7 @@ def main():
     l3out_node_group = mso_template.get_l3out_node_group(name, l3out_object.details)
 
     if name and l3out_node_group:
-        mso.existing = copy.deepcopy(l3out_node_group.details)
-        mso.previous = copy.deepcopy(l3out_node_group.details)  # Query a specific object
+        mso.existing = mso.previous = copy.deepcopy(l3out_node_group.details)  # Query a specific object
     elif l3out_node_group:
         mso.existing = l3out_node_group  # Query all objects
 
@@ -262,7 +261,7 @@ def main():
     if state == "present":
         if bfd:
             # True if all elements are None, False otherwise.
-            bfd_is_empty = check_if_all_elements_are_none(list(bfd.values()))
+            bfd_is_empty = check_if_all_elements_are_none(bfd.values())
 
         l3out_node_routing_policy_object = None
         if node_routing_policy:
@@ -281,8 +280,8 @@ def main():
 
             if mso.existing.get("bfdMultiHop", {}).get("key", {}).get("ref"):
                 mso.existing["bfdMultiHop"]["key"].pop("ref", None)
-                mso.previous["bfdMultiHop"]["key"].pop("ref", None)
 
+            proposed_payload = copy.deepcopy(mso.existing)
             mso_values["description"] = description
 
             if node_routing_policy == "" and mso.existing.get(
@@ -311,8 +310,8 @@ def main():
 
             mso_values["targetDscp"] = target_dscp
 
-            append_update_ops_data(ops, mso.existing, node_group_policy_path, mso_values, mso_values_remove)
-            mso.sanitize(mso.existing, collate=True)
+            append_update_ops_data(ops, proposed_payload, node_group_policy_path, mso_values, mso_values_remove)
+            mso.sanitize(proposed_payload, collate=True)
         else:
             mso_values = dict(name=name)
             mso_values["description"] = description
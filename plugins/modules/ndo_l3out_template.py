@@ -874,8 +874,7 @@ def main():
                 proposed_payload.get("advancedRouteMapRefs", {}).pop("routeDampeningV4Ref", None)
 
             if outer_route_maps:
-                for key, value in outer_route_maps.items():
-                    proposed_payload["advancedRouteMapRefs"][key] = value
+                proposed_payload["advancedRouteMapRefs"].update(outer_route_maps)
 
             if ospf and ospf_state != "disabled":
                 originate_default_route = ORIGINATE_DEFAULT_ROUTE.get(ospf.get("originate_default_route"))
@@ -972,7 +971,7 @@ def main():
 
 
 def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
-    l3out_object["vrfName"] = mso_template.get_template_object_name_by_uuid("vrf", l3out_object.get("vrfRef"))
+    l3out_object["vrfName"] = mso_template.get_template_object_name_by_uuid("vrf", l3out_object.get("vrfRef"), use_cache=True)
 
     if not check_mode:
         l3out_relations = mso_template.mso.request("{0}/relations".format(mso_template.template_path), "GET")
@@ -980,7 +979,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
 
     if "exportRouteMapRef" in l3out_object:
         if check_mode:
-            l3out_object["exportRouteMapName"] = mso_template.get_template_object_name_by_uuid("routeMap", l3out_object["exportRouteMapRef"])
+            l3out_object["exportRouteMapName"] = mso_template.get_template_object_name_by_uuid("routeMap", l3out_object["exportRouteMapRef"], use_cache=True)
         else:
             l3out_object["exportRouteMapName"] = (
                 mso_template.get_object_by_key_value_pairs(
@@ -994,7 +993,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
 
     if "importRouteMapRef" in l3out_object:
         if check_mode:
-            l3out_object["importRouteMapName"] = mso_template.get_template_object_name_by_uuid("routeMap", l3out_object["importRouteMapRef"])
+            l3out_object["importRouteMapName"] = mso_template.get_template_object_name_by_uuid("routeMap", l3out_object["importRouteMapRef"], use_cache=True)
         else:
             l3out_object["importRouteMapName"] = (
                 mso_template.get_object_by_key_value_pairs(
@@ -1011,7 +1010,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "attachedHostRouteRedistRef" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["attachedHostRouteRedistName"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["attachedHostRouteRedistRef"]
+                    "routeMap", advanced_route_maps["attachedHostRouteRedistRef"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["attachedHostRouteRedistName"] = (
@@ -1027,7 +1026,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "connectedRouteRedistRef" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["connectedRouteRedistName"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["connectedRouteRedistRef"]
+                    "routeMap", advanced_route_maps["connectedRouteRedistRef"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["connectedRouteRedistName"] = (
@@ -1043,7 +1042,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "interleakRef" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["interleakName"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["interleakRef"]
+                    "routeMap", advanced_route_maps["interleakRef"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["interleakName"] = (
@@ -1059,7 +1058,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "routeDampeningV4Ref" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["routeDampeningV4Name"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["routeDampeningV4Ref"]
+                    "routeMap", advanced_route_maps["routeDampeningV4Ref"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["routeDampeningV4Name"] = (
@@ -1075,7 +1074,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "routeDampeningV6Ref" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["routeDampeningV6Name"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["routeDampeningV6Ref"]
+                    "routeMap", advanced_route_maps["routeDampeningV6Ref"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["routeDampeningV6Name"] = (
@@ -1091,7 +1090,7 @@ def insert_l3out_relation_name(l3out_object, mso_template, check_mode=False):
         if "staticRouteRedistRef" in advanced_route_maps:
             if check_mode:
                 l3out_object["advancedRouteMapRefs"]["staticRouteRedistName"] = mso_template.get_template_object_name_by_uuid(
-                    "routeMap", advanced_route_maps["staticRouteRedistRef"]
+                    "routeMap", advanced_route_maps["staticRouteRedistRef"], use_cache=True
                 )
             else:
                 l3out_object["advancedRouteMapRefs"]["staticRouteRedistName"] = (
@@ -204,8 +204,7 @@ def main():
 
     if route_map_policy_uuid or route_map_policy:
         if match:  # Query a specific object
-            mso.existing = copy.deepcopy(match.details)
-            mso.previous = copy.deepcopy(match.details)
+            mso.existing = mso.previous = copy.deepcopy(match.details)
     elif match:
         mso.existing = match  # Query all objects
 
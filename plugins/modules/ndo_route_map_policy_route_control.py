@@ -218,7 +218,8 @@ def main():
         ops.append(dict(op="remove", path=path))
 
     if mso.proposed:
-        mso.proposed = copy.deepcopy(mso.proposed)
+        # Only top level template keys are added to the proposed object, a shallow copy keeps mso.sent untouched
+        mso.proposed = dict(mso.proposed)
         mso_template.update_config_with_template_and_references(mso.proposed)
 
     if not module.check_mode and ops:
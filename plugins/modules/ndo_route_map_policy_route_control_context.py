@@ -247,7 +247,24 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.mso.plugins.module_utils.mso import MSOModule, mso_argument_spec
 from ansible_collections.cisco.mso.plugins.module_utils.template import KVPair
 from ansible_collections.cisco.mso.plugins.module_utils.templates import MSOTemplates
-from ansible_collections.cisco.mso.plugins.module_utils.utils import append_update_ops_data, check_if_all_elements_are_none
+from ansible_collections.cisco.mso.plugins.module_utils.utils import append_update_ops_data
+
+REFERENCE_DETAILS = {
+    "matchRule": {
+        "name": "matchRuleName",
+        "reference": "matchRuleRef",
+        "type": "matchRule",
+        "template": "matchRuleTemplateName",
+        "templateId": "matchRuleTemplateId",
+    },
+    "setRule": {
+        "name": "setRuleName",
+        "reference": "setRuleRef",
+        "type": "setRule",
+        "template": "setRuleTemplateName",
+        "templateId": "setRuleTemplateId",
+    },
+}
 
 
 def main():
@@ -337,36 +354,22 @@ def main():
     mso_template = mso_templates.get_template("tenant", template_name, template_id)
     mso_template.validate_template("tenantPolicy")
     route_map_policy_object = mso_template.get_route_map_policy(route_map_policy_uuid, route_map_policy, template_object=None, fail_module=True)
-    reference_details = {
-        "matchRule": {
-            "name": "matchRuleName",
-            "reference": "matchRuleRef",
-            "type": "matchRule",
-            "template": "matchRuleTemplateName",
-            "templateId": "matchRuleTemplateId",
-        },
-        "setRule": {
-            "name": "setRuleName",
-            "reference": "setRuleRef",
-            "type": "setRule",
-            "template": "setRuleTemplateName",
-            "templateId": "setRuleTemplateId",
-        },
-    }
 
     if name:  # Query a specific object
         match = mso_template.get_object_by_key_value_pairs(
             "Route Map Policy Route Control Context", route_map_policy_object.details.get("contexts", []), [KVPair("name", name)]
         )
         if match:
-            if match.details.get("matchRules"):
-                match.details["matchRules"] = match_rules_list_to_dict(match.details.get("matchRules"))
-            mso.previous = mso.existing = mso_template.update_config_with_template_and_references(copy.deepcopy(match.details), reference_details, False)
+            # Keep the match rule UUIDs of match.details as returned by the API so unchanged match rules do not create a PATCH operation
+            existing_context = copy.deepcopy(match.details)
+            if existing_context.get("matchRules"):
+                existing_context["matchRules"] = match_rules_list_to_dict(existing_context.get("matchRules"))
+            mso.previous = mso.existing = mso_template.update_config_with_template_and_references(existing_context, REFERENCE_DETAILS, False, True)
     elif route_map_policy_object.details.get("contexts", []):  # Query all objects
         for obj in route_map_policy_object.details.get("contexts", []):
             if obj.get("matchRules"):
                 obj["matchRules"] = match_rules_list_to_dict(obj.get("matchRules"))
-            mso_template.update_config_with_template_and_references(obj, reference_details, False)
+            mso_template.update_config_with_template_and_references(obj, REFERENCE_DETAILS, False, True)
         mso.existing = route_map_policy_object.details.get("contexts", [])  # Query all
 
     if state != "query":
@@ -377,7 +380,7 @@ def main():
         if set_rule:
             set_rule_uuid = set_rule.get("uuid")
             set_rule_reference = set_rule.get("reference")
-            if not set_rule_uuid and set_rule_reference and not check_if_all_elements_are_none(set_rule_reference.values()):
+            if not set_rule_uuid and set_rule_reference and any(set_rule_reference.values()):
                 set_rule_template = mso_templates.get_template("tenant", set_rule_reference.get("template"), set_rule_reference.get("template_id"))
                 set_rule_policy_match = set_rule_template.get_set_rule_policy_object(
                     uuid=None, name=set_rule_reference.get("name"), search_object=None, fail_module=True
@@ -389,13 +392,21 @@ def main():
             for match_rule in match_rules:
                 if match_rule and match_rule.get("uuid"):
                     match_rule_uuids.append(match_rule.get("uuid"))
-                elif match_rule and not check_if_all_elements_are_none(match_rule.get("reference", {}).values()):
+                elif match_rule and any((match_rule.get("reference") or {}).values()):
                     ref = match_rule.get("reference")
                     match_rule_template = mso_templates.get_template("tenant", ref.get("template"), ref.get("template_id"))
                     match_rule_policy_match = match_rule_template.get_match_rule_policy_object(
                         uuid=None, name=ref.get("name"), search_object=None, fail_module=True
                     )
                     match_rule_uuids.append(match_rule_policy_match.details.get("uuid"))
+            # Drop duplicate match rules while keeping the order provided by the user
+            seen_match_rule_uuids = set()
+            unique_match_rule_uuids = []
+            for match_rule_uuid in match_rule_uuids:
+                if match_rule_uuid not in seen_match_rule_uuids:
+                    seen_match_rule_uuids.add(match_rule_uuid)
+                    unique_match_rule_uuids.append(match_rule_uuid)
+            match_rule_uuids = unique_match_rule_uuids
 
         mso_values = {
             "name": name,
@@ -409,6 +420,10 @@ def main():
             mso_values["order"] = order
 
         if match:
+            # The API omits cleared attributes, an empty value for an attribute that is not set must not create an add operation
+            for key in ("description", "matchRules", "setRuleRef"):
+                if not mso_values.get(key) and key not in match.details:
+                    mso_values.pop(key, None)
             append_update_ops_data(ops, match.details, path, mso_values)
             mso.sanitize(mso_values, collate=True)
         else:
@@ -419,12 +434,13 @@ def main():
         ops.append(dict(op="remove", path=path))
 
     if mso.proposed:
-        mso.proposed = copy.deepcopy(mso.proposed)
-        mso.proposed["matchRules"] = match_rules_list_to_dict(mso.proposed.get("matchRules", []))
-        proposed_reference_details = copy.deepcopy(reference_details)
+        # The match rules are the only nested objects of a context, rebuilding them in a shallow copy keeps mso.sent unchanged
+        mso.proposed = dict(mso.proposed, matchRules=match_rules_list_to_dict(mso.proposed.get("matchRules", [])))
         if mso.proposed.get("setRuleRef") == "":
-            proposed_reference_details.pop("setRule", None)
-        mso_template.update_config_with_template_and_references(mso.proposed, proposed_reference_details, False)
+            proposed_reference_details = {key: value for key, value in REFERENCE_DETAILS.items() if key != "setRule"}
+        else:
+            proposed_reference_details = REFERENCE_DETAILS
+        mso_template.update_config_with_template_and_references(mso.proposed, proposed_reference_details, False, True)
 
     if not module.check_mode and ops:
         response = mso.request(mso_template.template_path, method="PATCH", data=ops)
@@ -437,7 +453,7 @@ def main():
         if match:
             if match.details.get("matchRules"):
                 match.details["matchRules"] = match_rules_list_to_dict(match.details.get("matchRules"))
-            mso.existing = mso_template.update_config_with_template_and_references(match.details, reference_details, False)  # When the state is present
+            mso.existing = mso_template.update_config_with_template_and_references(match.details, REFERENCE_DETAILS, False, True)  # When the state is present
         else:
             mso.existing = {}  # When the state is absent
 
@@ -429,8 +429,7 @@ def main():
     if (name or uuid) and match:
         set_rule_policy_path = "{0}/{1}".format(path, match.index)
         mso_template.update_config_with_template_and_references(match.details)
-        mso.existing = copy.deepcopy(match.details)
-        mso.previous = copy.deepcopy(match.details)
+        mso.existing = mso.previous = copy.deepcopy(match.details)
     elif match:
         mso.existing = mso.previous = [mso_template.update_config_with_template_and_references(obj) for obj in match]
 
@@ -479,17 +479,17 @@ def main():
         )
 
         if state_limit_route_map:
-            empty_state_limit_route_map = check_if_all_elements_are_none(list(state_limit_route_map.values()))
+            empty_state_limit_route_map = check_if_all_elements_are_none(state_limit_route_map.values())
             if not empty_state_limit_route_map:
                 mso_values["stateLimitRouteMapRef"] = mso_template.get_route_map_policy_for_multicast_uuid(state_limit_route_map.get("name"))
 
         if report_policy_route_map:
-            empty_report_policy_route_map = check_if_all_elements_are_none(list(report_policy_route_map.values()))
+            empty_report_policy_route_map = check_if_all_elements_are_none(report_policy_route_map.values())
             if not empty_report_policy_route_map:
                 mso_values["reportPolicyRouteMapRef"] = mso_template.get_route_map_policy_for_multicast_uuid(report_policy_route_map.get("name"))
 
         if static_report_route_map:
-            empty_static_report_route_map = check_if_all_elements_are_none(list(static_report_route_map.values()))
+            empty_static_report_route_map = check_if_all_elements_are_none(static_report_route_map.values())
             if not empty_static_report_route_map:
                 mso_values["staticReportRouteMapRef"] = mso_template.get_route_map_policy_for_multicast_uuid(static_report_route_map.get("name"))
 
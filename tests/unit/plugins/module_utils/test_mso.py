@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, Sabari Jaganathan (@sajagana) <sajagana@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import math
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils import mso
+from ansible_collections.cisco.mso.plugins.module_utils.mso import json_dumps, json_loads
+
+HAS_ORJSON = [True, False] if mso.HAS_ORJSON else [False]
+
+RESPONSE_BODIES = [
+    '{"name": "ansible_test", "displayName": "Ansible Test", "templates": [{"uuid": "1234"}], "count": 2, "enabled": true, "ref": null}',
+    '[1, -2, 3.5, "text", {"nested": {"list": []}}]',
+    '"\\u00e9t\\u00e9"',
+    # Integers outside of the 64-bit range are kept exact
+    '{"id": 18446744073709551616}',
+    '{"id": -9223372036854775809}',
+    '{"id": 9223372036854775807, "other": -9223372036854775808}',
+    # Values that orjson does not accept
+    '{"value": NaN}',
+    '{"value": Infinity}',
+    '{"value": 1e400}',
+    '"\\ud800"',
+]
+
+
+@pytest.fixture(params=HAS_ORJSON, ids=lambda has_orjson: "orjson" if has_orjson else "json")
+def has_orjson(request, monkeypatch):
+    monkeypatch.setattr(mso, "HAS_ORJSON", request.param)
+    return request.param
+
+
+def assert_same_json_value(value, expected):
+    if isinstance(expected, float) and math.isnan(expected):
+        assert isinstance(value, float) and math.isnan(value)
+    else:
+        assert type(value) is type(expected)
+        assert value == expected
+
+
+@pytest.mark.parametrize("body", RESPONSE_BODIES)
+def test_json_loads_matches_json(has_orjson, body):
+    expected = json.loads(body)
+    for data in (body, body.encode("utf-8")):
+        result = json_loads(data)
+        if isinstance(expected, dict):
+            assert list(result) == list(expected)
+            for key in expected:
+                assert_same_json_value(result[key], expected[key])
+        else:
+            assert_same_json_value(result, expected)
+
+
+def test_json_loads_keeps_exact_large_integers(has_orjson):
+    assert json_loads('{"id": 18446744073709551616}')["id"] == 18446744073709551616
+    assert json_loads(b"[-9223372036854775809]") == [-9223372036854775809]
+
+
+@pytest.mark.parametrize("body", ["", "{", "[1,]", "{'name': 'ansible_test'}"])
+def test_json_loads_invalid_json(has_orjson, body):
+    with pytest.raises(ValueError):
+        json_loads(body)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [{"op": "replace", "path": "/tenantPolicyTemplate/template/name", "value": "ansible_test"}],
+        {"name": "ansible_test", "count": 2, "enabled": True, "ref": None, "list": [1.5, "text"]},
+        # Data that orjson does not accept
+        {1: "integer key"},
+        {"id": 18446744073709551616},
+    ],
+)
+def test_json_dumps_matches_json(has_orjson, data):
+    result = json_dumps(data)
+    assert isinstance(result, str)
+    assert json.loads(result) == json.loads(json.dumps(data))
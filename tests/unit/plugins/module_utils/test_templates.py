@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, Sabari Jaganathan (@sajagana) <sajagana@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.templates import MSOTemplates
+
+TEMPLATES = [
+    {"templateId": "1", "displayName": "ansible_tenant_template", "templateType": "tenantPolicy", "tenantPolicyTemplate": {"template": {}}},
+    {"templateId": "2", "displayName": "ansible_tenant_template_2", "templateType": "tenantPolicy", "tenantPolicyTemplate": {"template": {}}},
+]
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeMSOModule:
+    """Serves the templates API requests used by MSOTemplate from a list of templates"""
+
+    def __init__(self, templates):
+        self.templates = templates
+        self.template_requests = []
+
+    def query_objs(self, path, **kwargs):
+        summaries = [
+            dict(templateId=template.get("templateId"), templateName=template.get("displayName"), templateType=template.get("templateType"))
+            for template in self.templates
+        ]
+        return [summary for summary in summaries if all(summary.get(key) == value for key, value in kwargs.items() if value is not None)]
+
+    def get_obj(self, path, **kwargs):
+        summaries = self.query_objs(path, **kwargs)
+        return summaries[0] if summaries else {}
+
+    def query_obj(self, path):
+        self.template_requests.append(path)
+        template_id = path.split("/")[-1]
+        return next((copy.deepcopy(template) for template in self.templates if template.get("templateId") == template_id), {})
+
+    def fail_json(self, msg, **kwargs):
+        raise FailJson(msg)
+
+
+def test_get_template_not_found_is_not_returned_for_other_templates():
+    mso_templates = MSOTemplates(FakeMSOModule(TEMPLATES))
+
+    missing_template = mso_templates.get_template("tenant", "missing_template", None, fail_module=False)
+    assert missing_template.template == {}
+    assert missing_template.template_id is None
+
+    template = mso_templates.get_template("tenant", "ansible_tenant_template_2", None)
+    assert template.template_id == "2"
+    assert template.template_name == "ansible_tenant_template_2"
+
+
+def test_get_template_not_found_by_name_fails_module():
+    mso_templates = MSOTemplates(FakeMSOModule(TEMPLATES))
+
+    with pytest.raises(FailJson, match="Provided template name 'missing_template' does not exist"):
+        mso_templates.get_template("tenant", "missing_template", None, fail_module=True)
+
+
+def test_get_template_uses_cache_for_found_templates():
+    mso = FakeMSOModule(TEMPLATES)
+    mso_templates = MSOTemplates(mso)
+
+    template = mso_templates.get_template("tenant", "ansible_tenant_template", None)
+    assert mso_templates.get_template("tenant", "ansible_tenant_template", None) is template
+    assert mso_templates.get_template("tenant", None, "1") is template
+    assert mso.template_requests == ["templates/1"]
+
+    assert mso_templates.get_template("tenant", "ansible_tenant_template", None, refresh=True) is not template
+    assert mso.template_requests == ["templates/1", "templates/1"]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, Sabari Jaganathan (@sajagana) <sajagana@cisco.com>
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import OrderedDict
+
+import pytest
+
+from ansible_collections.cisco.mso.plugins.module_utils.utils import append_update_ops_data, delete_none_values
+
+
+@pytest.mark.parametrize(
+    "obj_to_sanitize, recursive, expected",
+    [
+        ({"name": "ansible_test", "description": None}, True, {"name": "ansible_test"}),
+        (["ansible_test", None, 0, ""], True, ["ansible_test", 0, ""]),
+        ({"bfdPol": {"adminState": None, "detectionMultiplier": 3}, "list": [None, {"a": None}]}, True, {"bfdPol": {"detectionMultiplier": 3}, "list": [{}]}),
+        ({"bfdPol": {"adminState": None}, "description": None}, False, {"bfdPol": {"adminState": None}}),
+        # Nested dict and list subclasses are sanitized as well
+        ({"o": OrderedDict([("a", None), ("b", 1)])}, True, {"o": {"b": 1}}),
+        ([OrderedDict([("a", None), ("b", 1)])], True, [{"b": 1}]),
+    ],
+)
+def test_delete_none_values(obj_to_sanitize, recursive, expected):
+    assert delete_none_values(obj_to_sanitize, recursive) == expected
+
+
+def test_delete_none_values_does_not_modify_input():
+    obj_to_sanitize = {"name": "ansible_test", "nested": {"description": None}}
+    delete_none_values(obj_to_sanitize)
+    assert obj_to_sanitize == {"name": "ansible_test", "nested": {"description": None}}
+
+
+def test_delete_none_values_invalid_type():
+    with pytest.raises(TypeError):
+        delete_none_values("ansible_test")
+
+
+def test_append_update_ops_data():
+    existing_data = {
+        "name": "name",
+        "description": "description",
+        "bfdMultiHopPol": {"adminState": "enabled", "minRxInterval": 250, "ifControl": {"adminState": "enabled"}},
+        "bfdPol": {"adminState": "enabled", "detectionMultiplier": 3},
+    }
+    ops = []
+    update_path = "/tenantPolicyTemplate/template/l3OutIntfPolGroups/1"
+    replace_data = {
+        "name": "new_name",
+        "description": "description",
+        "ospfIntfPol": dict(ifControl=dict(adminState="disabled"), cost=0),
+        ("bfdPol", "detectionMultiplier"): 5,
+        "targetDscp": None,
+    }
+    remove_data = [("bfdMultiHopPol", "ifControl", "adminState"), "bfdPol"]
+
+    append_update_ops_data(ops, existing_data, update_path, replace_data, remove_data)
+
+    assert ops == [
+        {"op": "replace", "path": "{0}/name".format(update_path), "value": "new_name"},
+        {"op": "add", "path": "{0}/ospfIntfPol".format(update_path), "value": {"ifControl": {"adminState": "disabled"}, "cost": 0}},
+        {"op": "replace", "path": "{0}/bfdPol/detectionMultiplier".format(update_path), "value": 5},
+        {"op": "remove", "path": "{0}/bfdMultiHopPol/ifControl/adminState".format(update_path)},
+        {"op": "remove", "path": "{0}/bfdPol".format(update_path)},
+    ]
+    assert existing_data == {
+        "name": "new_name",
+        "description": "description",
+        "bfdMultiHopPol": {"adminState": "enabled", "minRxInterval": 250, "ifControl": {}},
+        "ospfIntfPol": {"ifControl": {"adminState": "disabled"}, "cost": 0},
+    }
+    # The value in the ops payload does not share objects with the updated existing data
+    assert ops[1]["value"] is not existing_data["ospfIntfPol"]
+    assert ops[1]["value"]["ifControl"] is not existing_data["ospfIntfPol"]["ifControl"]
+
+
+def test_append_update_ops_data_skips_missing_parents():
+    existing_data = {"name": "name", "bfdPol": {"adminState": "enabled"}}
+    ops = []
+
+    append_update_ops_data(ops, existing_data, "/path", {("ospfIntfPol", "cost"): 0}, [("ospfIntfPol", "cost"), ("bfdPol", "keyID")])
+
+    assert ops == []
+    assert existing_data == {"name": "name", "bfdPol": {"adminState": "enabled"}}
+
+
+@pytest.mark.parametrize("replace_data, remove_data", [(["name"], None), (None, {"name": None})])
+def test_append_update_ops_data_invalid_type(replace_data, remove_data):
+    with pytest.raises(TypeError):
+        append_update_ops_data([], {"name": "name"}, "/path", replace_data, remove_data)